@@ -13,19 +13,50 @@ Usage:
         result = dp.parse_folder("input/requirements", "processed/requirements")
 """
 
+import os
 import sys
+import json
 import logging
 import argparse
+import multiprocessing
+from concurrent.futures import (
+    Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
 from pathlib import Path
-from typing import List, Optional, cast
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Tuple, cast
 from dataclasses import dataclass
 
 try:
-    from docling.document_converter import DocumentConverter
+    from docling.datamodel.base_models import ConversionStatus, InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+    from docling.datamodel.settings import settings
+    from docling.document_converter import DocumentConverter, PdfFormatOption
 except ImportError:
     print("❌ Error: docling is not installed. Install with: pip install docling")
     sys.exit(1)
 
+try:
+    from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+except ImportError:
+    try:
+        # Older docling releases define these in pipeline_options
+        from docling.datamodel.pipeline_options import AcceleratorDevice, AcceleratorOptions
+    except ImportError:
+        # Early 2.x releases have no accelerator settings at all
+        AcceleratorDevice = None  # type: ignore[assignment,misc]
+        AcceleratorOptions = None  # type: ignore[assignment,misc]
+
+# Content hash used for the incremental-run cache. It is not security
+# relevant, so faster optional backends are preferred when installed.
+# export_to_xlsx.py uses the same fallback order.
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    try:
+        from xxhash import xxh3_128 as _hasher  # type: ignore[no-redef]
+    except ImportError:
+        from hashlib import sha256 as _hasher  # type: ignore[no-redef]
+
 # Logger configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +76,85 @@ class ParsingResult:
     errors: List[str]
 
 
+# Per-process converter, created on first use and shared by every
+# DocumentParser and worker task so the docling models load only once.
+# It is rebuilt only when a caller asks for different pipeline options.
+_CONVERTER: Optional[DocumentConverter] = None
+_CONVERTER_OPTIONS: Optional[dict] = None
+
+
+def _build_converter(options: dict) -> DocumentConverter:
+    """
+    Create a DocumentConverter with the given PDF pipeline options.
+
+    Args:
+        options: Dictionary with do_ocr, table_mode, num_threads and device.
+            num_threads and device are only passed to docling when set, so
+            OMP_NUM_THREADS, DOCLING_NUM_THREADS and DOCLING_DEVICE still
+            apply otherwise.
+    """
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = options['do_ocr']
+    pipeline_options.table_structure_options.mode = TableFormerMode(options['table_mode'])
+
+    accelerator_kwargs: dict = {}
+    if options.get('num_threads') is not None:
+        accelerator_kwargs['num_threads'] = options['num_threads']
+    if options.get('device') is not None:
+        accelerator_kwargs['device'] = options['device']
+    if accelerator_kwargs:
+        if AcceleratorOptions is None:
+            logger.warning("⚠️ This docling version does not support "
+                           "num_threads/device; ignoring them")
+        else:
+            if 'device' in accelerator_kwargs:
+                accelerator_kwargs['device'] = AcceleratorDevice(accelerator_kwargs['device'])
+            pipeline_options.accelerator_options = AcceleratorOptions(**accelerator_kwargs)
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+
+
+def _get_converter(options: dict) -> DocumentConverter:
+    """Return the process-wide DocumentConverter, creating it on first use."""
+    global _CONVERTER, _CONVERTER_OPTIONS
+    if _CONVERTER is None or _CONVERTER_OPTIONS != options:
+        _CONVERTER = _build_converter(options)
+        _CONVERTER_OPTIONS = dict(options)
+    return _CONVERTER
+
+
+def _convert_one(path: str, out_dir: str,
+                 options: dict) -> Tuple[str, bool, Optional[str]]:
+    """
+    Convert a single file to Markdown inside a worker process.
+
+    Args:
+        path: Path to the source file
+        out_dir: Directory to save the result
+        options: Converter options (see DocumentParser.converter_options)
+
+    Returns:
+        Tuple of (file name, converted flag, error message or None)
+    """
+    file_path = Path(path)
+    output_file = Path(out_dir) / f"_parsed_{file_path.stem}.md"
+
+    try:
+        converter = _get_converter(options)
+        logger.info(f"🔄 Parsing: {file_path.name}")
+        result = converter.convert(path)
+        md_content = result.document.export_to_markdown()
+        output_file.write_text(md_content, encoding='utf-8')
+        logger.info(f"✅ Success: {file_path.name} → {output_file.name}")
+        return file_path.name, True, None
+    except Exception as e:
+        logger.error(f"❌ Error in {file_path.name}: {e}")
+        return file_path.name, False, str(e)
+
+
 class DocumentParser:
     """
     Document parser based on docling.
@@ -53,22 +163,134 @@ class DocumentParser:
         PDF, DOCX, PPTX, XLSX, HTML, HTM, MD, TXT, PNG, JPG, JPEG, TIFF, TIF
     """
 
-    SUPPORTED_EXTENSIONS = {
+    SUPPORTED_EXTENSIONS: ClassVar[FrozenSet[str]] = frozenset({
         '.pdf', '.docx', '.pptx', '.xlsx', '.html',
         '.htm', '.md', '.txt', '.png', '.jpg',
         '.jpeg', '.tiff', '.tif'
-    }
+    })
+
+    # Sidecar manifest in the output directory that records the state of
+    # each converted source file (export_to_xlsx.py keeps a copy of this
+    # cache logic for its own manifest; keep the two in sync)
+    MANIFEST_NAME = '.casely_cache.json'
 
-    def __init__(self, config: Optional[dict] = None):
+    def __init__(self, config: Optional[dict] = None,
+                 max_workers: Optional[int] = 1):
         """
         Initialize the parser.
 
         Args:
-            config: Configuration dictionary (encoding, overwrite, etc.)
+            config: Configuration dictionary. PDF pipeline keys:
+                do_ocr (default True), table_mode ('fast' or 'accurate',
+                default 'fast'), num_threads and device ('auto', 'cpu',
+                'cuda', 'mps'). When num_threads or device is not set,
+                docling's defaults and environment variables apply.
+                doc_batch_size and page_batch_size tune docling's batching
+                for in-process folder conversion.
+            max_workers: Number of worker processes used by parse_folder.
+                1 converts files in the current process, None uses one
+                worker per CPU. Each worker loads its own docling models.
         """
         logger.info("🚀 Initializing Docling parser")
-        self.converter = DocumentConverter()
         self.config = config or {}
+        self.max_workers = max_workers
+
+        self.converter_options = {
+            'do_ocr': bool(self.config.get('do_ocr', True)),
+            'table_mode': self.config.get('table_mode', 'fast'),
+            'num_threads': self.config.get('num_threads'),
+            'device': self.config.get('device'),
+        }
+        self.converter = _get_converter(self.converter_options)
+
+        # Document/page batching used by convert_all in parse_folder
+        if 'doc_batch_size' in self.config:
+            settings.perf.doc_batch_size = self.config['doc_batch_size']
+        if 'page_batch_size' in self.config:
+            settings.perf.page_batch_size = self.config['page_batch_size']
+        # Source name -> {digest, mtime_ns, size} for the current output dir
+        self._manifest: Dict[str, dict] = {}
+
+    @classmethod
+    def _load_manifest(cls, output_dir: Path) -> Dict[str, dict]:
+        """Load the conversion manifest for output_dir, or an empty one."""
+        manifest_path = output_dir / cls.MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable cache {manifest_path.name}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @classmethod
+    def _save_manifest(cls, output_dir: Path, manifest: Dict[str, dict]) -> None:
+        """Write the conversion manifest for output_dir."""
+        manifest_path = output_dir / cls.MANIFEST_NAME
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True),
+                                 encoding='utf-8')
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """
+        Return the hex digest of a file, read in 1 MiB chunks.
+
+        Uses blake3 or xxh3_128 when available, otherwise SHA-256.
+        """
+        h = _hasher()
+        with file_path.open('rb') as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _source_state(self, file_path: Path) -> dict:
+        """
+        Describe the current state of a source file.
+
+        The file is only hashed when its size or mtime differ from the
+        manifest entry, so unchanged files cost a single stat call.
+        """
+        st = file_path.stat()
+        entry = self._manifest.get(file_path.name)
+        if (entry and entry.get('mtime_ns') == st.st_mtime_ns
+                and entry.get('size') == st.st_size):
+            digest = entry['digest']
+        else:
+            digest = self._hash_file(file_path)
+        return {'digest': digest, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+    def _is_up_to_date(self, file_path: Path, output_file: Path) -> Tuple[bool, dict]:
+        """
+        Check whether output_file still matches the source file.
+
+        An output without a manifest entry cannot be verified (the manifest
+        was deleted, or the output predates it), so the source is parsed
+        again.
+
+        Returns:
+            Tuple of (up-to-date flag, current source state)
+        """
+        state = self._source_state(file_path)
+        if not output_file.exists():
+            return False, state
+
+        entry = self._manifest.get(file_path.name)
+        if entry is None:
+            logger.info(f"♻️ No cache entry: {file_path.name}")
+            return False, state
+        if entry.get('digest') == state['digest']:
+            self._manifest[file_path.name] = state
+            return True, state
+
+        logger.info(f"♻️ Source changed: {file_path.name}")
+        return False, state
+
+    @staticmethod
+    def _write_output(file_path: Path, output_file: Path, md_content: str) -> None:
+        """Write converted Markdown to disk and log the result."""
+        output_file.write_text(md_content, encoding='utf-8')
+        logger.info(f"✅ Success: {file_path.name} → {output_file.name}")
 
     def parse_file(self, file_path: Path, output_dir: Path) -> bool:
         """
@@ -83,7 +305,8 @@ class DocumentParser:
         """
         output_file = output_dir / f"_parsed_{file_path.stem}.md"
 
-        if output_file.exists():
+        up_to_date, state = self._is_up_to_date(file_path, output_file)
+        if up_to_date:
             logger.info(f"⏭️ Already processed: {output_file.name}")
             return False
 
@@ -91,8 +314,8 @@ class DocumentParser:
             logger.info(f"🔄 Parsing: {file_path.name}")
             result = self.converter.convert(str(file_path))
             md_content = result.document.export_to_markdown()
-            output_file.write_text(md_content, encoding='utf-8')
-            logger.info(f"✅ Success: {file_path.name} → {output_file.name}")
+            self._write_output(file_path, output_file, md_content)
+            self._manifest[file_path.name] = state
             return True
         except Exception as e:
             logger.error(f"❌ Error in {file_path.name}: {e}")
@@ -102,7 +325,9 @@ class DocumentParser:
         """
         Parses all supported files from raw_dir into ready_dir.
 
-        Saves as _parsed_{name}.md. Skips already processed files.
+        Saves as _parsed_{name}.md. Skips files whose content has not
+        changed since they were last converted, as recorded in the
+        .casely_cache.json manifest inside ready_dir.
 
         Args:
             raw_dir: Source directory
@@ -120,21 +345,43 @@ class DocumentParser:
             return ParsingResult(0, 0, [f"Directory not found: {raw_dir}"])
 
         result = ParsingResult(processed=0, skipped=0, errors=[])
+        self._manifest = self._load_manifest(ready_path)
+
+        pending: Dict[Path, dict] = {}
+        with os.scandir(raw_path) as it:
+            for entry in it:
+                # DirEntry caches the file type, so unsupported entries
+                # are rejected without an extra stat call; only the short
+                # suffix is lowercased
+                name = entry.name
+                dot = name.rfind('.')
+                if (dot <= 0 or not entry.is_file() or
+                        name[dot:].lower() not in self.SUPPORTED_EXTENSIONS):
+                    logger.debug(f"⏭️ Unsupported format: {name}")
+                    continue
+
+                file_path = Path(entry.path)
+                output_file = ready_path / f"_parsed_{file_path.stem}.md"
+                try:
+                    up_to_date, state = self._is_up_to_date(file_path, output_file)
+                except OSError as e:
+                    result.errors.append(f"{file_path.name}: {str(e)}")
+                    continue
+                if up_to_date:
+                    logger.info(f"⏭️ Already processed: {output_file.name}")
+                    result.skipped += 1
+                else:
+                    pending[file_path] = state
 
-        for file_path in raw_path.iterdir():
-            if not (file_path.is_file() and
-                    file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS):
-                logger.debug(f"⏭️ Unsupported format: {file_path.name}")
-                continue
+        if self.max_workers == 1 or len(pending) < 2:
+            self._convert_batch(pending, ready_path, result)
+        else:
+            self._convert_parallel(pending, ready_path, result)
 
-            try:
-                success = self.parse_file(file_path, ready_path)
-                if success:
-                    result.processed += 1
-                else:
-                    result.skipped += 1
-            except Exception as e:
-                result.errors.append(f"{file_path.name}: {str(e)}")
+        try:
+            self._save_manifest(ready_path, self._manifest)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write {self.MANIFEST_NAME}: {e}")
 
         logger.info(f"🎉 Folder complete: {raw_dir} → {ready_dir} "
                     f"({result.processed} new, {result.skipped} skipped)")
@@ -143,6 +390,112 @@ class DocumentParser:
 
         return result
 
+    def _convert_batch(self, pending: Dict[Path, dict], output_dir: Path,
+                       result: ParsingResult) -> None:
+        """
+        Convert files in the current process with a single convert_all call.
+
+        Markdown is written by a single background thread, so writing one
+        file overlaps the conversion of the next while writes stay serialized.
+
+        Args:
+            pending: Source files to convert, mapped to their source state
+            output_dir: Directory to save the results
+            result: ParsingResult updated in place
+        """
+        if not pending:
+            return
+
+        remaining = {fp.name: fp for fp in pending}
+        writes: List[Tuple[Path, Future]] = []
+        logger.info(f"🔄 Parsing {len(pending)} file(s)")
+
+        # A single writer thread keeps writes in order: sources sharing a
+        # stem (Spec.pdf, Spec.docx) target the same _parsed_ file
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            try:
+                conversions = self.converter.convert_all(
+                    [str(fp) for fp in pending], raises_on_error=False
+                )
+                for conv in conversions:
+                    file_path = remaining.pop(Path(conv.input.file).name, None)
+                    if file_path is None:
+                        continue
+                    if conv.status not in (ConversionStatus.SUCCESS,
+                                           ConversionStatus.PARTIAL_SUCCESS):
+                        message = '; '.join(e.error_message for e in conv.errors)
+                        message = message or f"conversion {conv.status.value}"
+                        logger.error(f"❌ Error in {file_path.name}: {message}")
+                        result.errors.append(f"{file_path.name}: {message}")
+                        continue
+                    try:
+                        md_content = conv.document.export_to_markdown()
+                    except Exception as e:
+                        logger.error(f"❌ Error in {file_path.name}: {e}")
+                        result.errors.append(f"{file_path.name}: {str(e)}")
+                        continue
+                    output_file = output_dir / f"_parsed_{file_path.stem}.md"
+                    future = writer.submit(
+                        self._write_output, file_path, output_file, md_content
+                    )
+                    writes.append((file_path, future))
+            except Exception as e:
+                logger.error(f"❌ Batch conversion failed: {e}")
+                for file_path in remaining.values():
+                    result.errors.append(f"{file_path.name}: {str(e)}")
+                remaining.clear()
+
+        for file_path in remaining.values():
+            result.errors.append(f"{file_path.name}: no conversion result")
+
+        # Surface errors from background writes
+        for file_path, future in writes:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"❌ Error in {file_path.name}: {e}")
+                result.errors.append(f"{file_path.name}: {str(e)}")
+                continue
+            self._manifest[file_path.name] = pending[file_path]
+            result.processed += 1
+
+    def _convert_parallel(self, pending: Dict[Path, dict], output_dir: Path,
+                          result: ParsingResult) -> None:
+        """
+        Convert files in a pool of worker processes.
+
+        Args:
+            pending: Source files to convert, mapped to their source state
+            output_dir: Directory to save the results
+            result: ParsingResult updated in place
+        """
+        # Spawn clean workers: forking a process that already loaded torch
+        # (or initialized CUDA) for an in-process conversion is not safe
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as ex:
+            futures = {
+                ex.submit(_convert_one, str(fp), str(output_dir),
+                          self.converter_options): fp
+                for fp in pending
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    # Skips are decided in parse_folder before dispatch, so a
+                    # worker either converts the file or reports an error
+                    name, _, error = future.result()
+                except Exception as e:
+                    # A crashed worker (e.g. killed for running out of memory)
+                    # breaks the pool and fails every unfinished file
+                    logger.error(f"❌ Error in {file_path.name}: {e!r}")
+                    result.errors.append(f"{file_path.name}: {e!r}")
+                    continue
+                if error is not None:
+                    result.errors.append(f"{name}: {error}")
+                else:
+                    self._manifest[name] = pending[file_path]
+                    result.processed += 1
+
     @classmethod
     def get_supported_formats(cls) -> str:
         """Returns string of supported extensions"""
@@ -151,15 +504,33 @@ class DocumentParser:
 
 def find_latest_project() -> Optional[Path]:
     """Find the most recently modified project directory."""
-    projects_dir = Path("projects")
-    if not projects_dir.exists():
+    try:
+        it = os.scandir("projects")
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    
-    subdirs = [d for d in projects_dir.iterdir() if d.is_dir()]
-    if not subdirs:
-        return None
-    
-    return max(subdirs, key=lambda d: d.stat().st_mtime)
+
+    latest: Optional[str] = None
+    latest_mtime = -1.0
+    with it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime > latest_mtime:
+                latest_mtime, latest = mtime, entry.path
+
+    return Path(latest) if latest is not None else None
+
+
+def _worker_count(value: str) -> int:
+    """argparse type for --workers: a non-negative integer (0 = one per CPU)."""
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {count}")
+    return count
 
 
 def main():
@@ -169,10 +540,29 @@ def main():
     )
     arg_parser.add_argument('input_dir', nargs='?', help='Source directory')
     arg_parser.add_argument('output_dir', nargs='?', help='Output directory (Markdown)')
+    arg_parser.add_argument('--workers', type=_worker_count, default=1,
+                            help='Number of parallel worker processes '
+                                 '(default: 1, 0 = one per CPU)')
+    arg_parser.add_argument('--no-ocr', action='store_true',
+                            help='Disable OCR for PDFs (faster, but scanned pages yield no text)')
+    arg_parser.add_argument('--table-mode', choices=['fast', 'accurate'], default='fast',
+                            help='Table structure model mode (default: fast)')
+    arg_parser.add_argument('--num-threads', type=int, default=None,
+                            help='CPU threads per worker (default: docling default, '
+                                 'honours OMP_NUM_THREADS/DOCLING_NUM_THREADS)')
+    arg_parser.add_argument('--device', choices=['auto', 'cpu', 'cuda', 'mps'], default=None,
+                            help='Accelerator device for docling models '
+                                 '(default: docling default, honours DOCLING_DEVICE)')
     args = arg_parser.parse_args()
 
     logger.info("📋 Supported formats: %s", DocumentParser.get_supported_formats())
-    parser = DocumentParser()
+    config = {
+        'do_ocr': not args.no_ocr,
+        'table_mode': args.table_mode,
+        'num_threads': args.num_threads,
+        'device': args.device,
+    }
+    parser = DocumentParser(config, max_workers=args.workers or None)
 
     # Case 1: Manual paths provided
     if args.input_dir and args.output_dir:
@@ -2,74 +2,241 @@
 Casely Export Module — converts Markdown test case tables into individual Excel files.
 """
 
+import io
+import os
 import re
 import sys
+import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple, Union
 
 try:
     from openpyxl import Workbook
-    from openpyxl.worksheet.worksheet import Worksheet
+    from openpyxl.cell import Cell, WriteOnlyCell
     from openpyxl.styles import Font, Alignment
     from openpyxl.utils import get_column_letter
 except ImportError:
     print("Error: openpyxl is required. Install it with: pip install openpyxl")
     sys.exit(1)
 
+# Hash for the export cache: blake3 or xxhash when installed, else SHA-256.
+# Same fallback order as casely_parser.py, so both caches hash identically.
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    try:
+        from xxhash import xxh3_128 as _hasher  # type: ignore[no-redef]
+    except ImportError:
+        from hashlib import sha256 as _hasher  # type: ignore[no-redef]
+
 MIN_COL_WIDTH = 10
 MAX_COL_WIDTH = 60
 
+# Manifest in the export directory recording the source state of each export
+CACHE_NAME = '.casely_export_cache.json'
+
+# Shared cell styles (openpyxl stores identical styles once per workbook)
+_HEADER_FONT = Font(bold=True)
+_HEADER_ALIGN = Alignment(horizontal='center', vertical='center')
+_WRAP_TOP = Alignment(wrap_text=True, vertical='top')
+
+# Line breaks inside cells: <br>, <BR>, <br/>, <br />
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+
+# Deletes the non-whitespace characters of separator rows like |---|:---:|;
+# a separator row is left with nothing but (Unicode) whitespace
+_SEP_DELETE = str.maketrans('', '', '-:|')
+
 
 def _split_table_row(line: str) -> List[str]:
     """Split a Markdown table row into individual cell values."""
-    raw_parts = re.split(r'(?<!\\)\|', line)
-    start: int = 1 if line.startswith('|') else 0
-    end: int = -1 if line.endswith('|') else len(raw_parts)
-
-    result: List[str] = []
-    raw_len = len(raw_parts)
-    for i in range(start, int(end) if end >= 0 else raw_len + int(end)):
-        cell = raw_parts[i]
-        if cell is not None:
-            result.append(cell.strip().replace(r'\|', '|'))
-    return result
-
-
-def parse_md_table(md_content: str) -> Tuple[List[str], List[List[str]]]:
-    """Parse a Markdown table into headers and data rows."""
-    lines: List[str] = [
-        line.strip()
-        for line in md_content.strip().split('\n')
-        if line.strip().startswith('|')
-    ]
-    if len(lines) < 2:
+    # Single pass over the line; a pipe preceded by a backslash is literal
+    cells: List[str] = []
+    buf: List[str] = []
+    prev = ''
+    for ch in line:
+        if ch == '|' and prev != '\\':
+            cells.append(''.join(buf).strip())
+            buf.clear()
+        else:
+            buf.append(ch)
+        prev = ch
+    cells.append(''.join(buf).strip())
+
+    # Drop the empty cells produced by the surrounding pipes
+    if line.startswith('|'):
+        cells = cells[1:]
+    if line.endswith('|'):
+        cells = cells[:-1]
+    return [cell.replace(r'\|', '|') for cell in cells]
+
+
+def parse_md_table(
+    md_content: Union[str, Iterable[str]]
+) -> Tuple[List[str], List[List[str]]]:
+    """
+    Parse a Markdown table into headers and data rows.
+
+    Accepts either the Markdown text or an iterable of lines, such as an
+    open file, so the file never has to be loaded as a single string.
+    """
+    # Iterate lazily: StringIO yields one line at a time without building
+    # a list of every line in the document
+    source: Iterable[str] = (
+        io.StringIO(md_content) if isinstance(md_content, str) else md_content
+    )
+    lines = (raw_line.strip() for raw_line in source)
+
+    # The first pipe-prefixed line is the header row
+    header_line = next((line for line in lines if line.startswith('|')), None)
+    if header_line is None:
         return [], []
 
-    headers: List[str] = _split_table_row(lines[0])
+    headers: List[str] = _split_table_row(header_line)
+    has_body = False
     rows: List[List[str]] = []
 
-    for line in lines[1:]:
+    for line in lines:
+        if not line.startswith('|'):
+            continue
+        has_body = True
+
         # Skip separator rows like |---|---|
-        if re.match(r'^\|[\s\-:|]+\|$', line):
+        if len(line) > 2 and line[-1] == '|' and not line.translate(_SEP_DELETE).strip():
             continue
 
         row: List[str] = _split_table_row(line)
         if not row:
             continue
 
-        # Pad short rows with empty strings
-        while len(row) < len(headers):
-            row.append('')
-
-        # Trim extra columns
-        rows.append(row[0:len(headers)])
+        # Pad short rows with empty strings, trim extra columns in place
+        missing = len(headers) - len(row)
+        if missing > 0:
+            row.extend([''] * missing)
+        elif missing < 0:
+            del row[len(headers):]
+        rows.append(row)
 
+    if not has_body:
+        return [], []
     return headers, rows
 
 
-def export_to_xlsx(results_dir: str, output_path: str) -> None:
-    """Convert each Markdown test case to a separate Excel file."""
+# The export cache below mirrors DocumentParser's cache in casely_parser.py
+# (kept as a copy so each script runs standalone): same entry format, and a
+# missing entry always means the file is processed again. Keep them in sync.
+
+def _hash_file(file_path: Path) -> str:
+    """Return the content digest of a file (see _hasher)."""
+    h = _hasher()
+    with file_path.open('rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _load_cache(out_dir: Path) -> Dict[str, dict]:
+    """Load the export manifest from out_dir, or return an empty one."""
+    cache_path = out_dir / CACHE_NAME
+    if not cache_path.exists():
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable {CACHE_NAME}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _source_state(md_file: Path, entry: Optional[dict]) -> dict:
+    """Return {digest, mtime_ns, size}, reusing the cached digest if stat matches."""
+    st = md_file.stat()
+    if (entry and entry.get('mtime_ns') == st.st_mtime_ns
+            and entry.get('size') == st.st_size):
+        digest = entry['digest']
+    else:
+        digest = _hash_file(md_file)
+    return {'digest': digest, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+
+def _export_one(md_path: str, out_dir: str) -> Tuple[bool, str]:
+    """
+    Convert a single Markdown file to Excel.
+
+    Returns:
+        Tuple of (exported flag, status message)
+    """
+    md_file = Path(md_path)
+    dest_dir = Path(out_dir)
+    with md_file.open('r', encoding='utf-8', buffering=1 << 20) as fh:
+        headers, rows = parse_md_table(fh)
+    if not headers:
+        return False, f"Skipping {md_file.name}: No table found."
+
+    # Clean cell values and measure column widths up front:
+    # a write-only worksheet needs its widths before the first row
+    col_widths: List[int] = [len(header) for header in headers]
+    clean_rows: List[List[str]] = []
+    for row in rows:
+        clean_row: List[str] = []
+        for col_idx, value in enumerate(row):
+            clean_value = _BR_RE.sub('\n', value) if value else ''
+            clean_row.append(clean_value)
+            # For multiline cells, use the longest line
+            longest = max((len(line) for line in clean_value.split('\n')), default=0)
+            if longest > col_widths[col_idx]:
+                col_widths[col_idx] = longest
+        clean_rows.append(clean_row)
+
+    # Create a new streaming workbook for each file
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Test Case")
+
+    # Auto-fit column widths
+    for col_idx, max_len in enumerate(col_widths, 1):
+        col_letter = get_column_letter(col_idx)
+        width = min(max(max_len + 2, MIN_COL_WIDTH), MAX_COL_WIDTH)
+        ws.column_dimensions[col_letter].width = width
+
+    # Write headers: bold + center
+    header_cells: List[Cell] = []
+    for header in headers:
+        header_cell = WriteOnlyCell(ws, value=header)
+        header_cell.font = _HEADER_FONT
+        header_cell.alignment = _HEADER_ALIGN
+        header_cells.append(header_cell)
+    ws.append(header_cells)
+
+    # Write data rows
+    for clean_row in clean_rows:
+        row_cells: List[Cell] = []
+        for clean_value in clean_row:
+            cell = WriteOnlyCell(ws, value=clean_value)
+            cell.alignment = _WRAP_TOP
+            row_cells.append(cell)
+        ws.append(row_cells)
+
+    # Save with the same name but .xlsx extension
+    # Serialize in memory and write the file with a single call
+    dest_file = dest_dir / f"{md_file.stem}.xlsx"
+    buf = io.BytesIO()
+    wb.save(buf)
+    dest_file.write_bytes(buf.getbuffer())
+    return True, f"Exported: {dest_file.name}"
+
+
+def export_to_xlsx(results_dir: str, output_path: str,
+                   max_workers: Optional[int] = None) -> None:
+    """
+    Convert each Markdown test case to a separate Excel file.
+
+    Files are exported in parallel worker processes; max_workers=None uses
+    one worker per CPU and max_workers=1 exports in the current process.
+    Files whose content is unchanged since their last export (recorded in
+    .casely_export_cache.json inside output_path) are skipped.
+    """
     results_path = Path(results_dir)
     out_dir = Path(output_path)
 
@@ -85,70 +252,72 @@ def export_to_xlsx(results_dir: str, output_path: str) -> None:
         print(f"Warning: No .md files found in {results_dir}")
         return
 
+    cache = _load_cache(out_dir)
+    pending: Dict[str, dict] = {}
     for md_file in md_files:
-        headers, rows = parse_md_table(md_file.read_text(encoding='utf-8'))
-        if not headers:
-            print(f"Skipping {md_file.name}: No table found.")
-            continue
-
-        # Create a new workbook for each file
-        wb = Workbook()
-        ws_opt = wb.active
-        if ws_opt is None:
-            print(f"Skipping {md_file.name}: Failed to create worksheet.")
-            continue
-        ws: Worksheet = ws_opt  # type: ignore[assignment]
-        ws.title = "Test Case"
-
-        # Write headers
-        for col_idx, header in enumerate(headers, 1):
-            ws.cell(row=1, column=col_idx, value=header)
-
-        # Write data rows
-        for row_idx, row in enumerate(rows, 2):
-            for col_idx, value in enumerate(row, 1):
-                clean_value = value.replace('<br>', '\n').replace('<BR>', '\n') if value else ''
-                cell = ws.cell(row=row_idx, column=col_idx, value=clean_value)
-                cell.alignment = Alignment(wrap_text=True, vertical='top')
-
-        # Style headers: bold + center
-        header_font = Font(bold=True)
-        for col_idx in range(1, len(headers) + 1):
-            header_cell = ws.cell(row=1, column=col_idx)
-            header_cell.font = header_font
-            header_cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Auto-fit column widths
-        for col_idx in range(1, len(headers) + 1):
-            max_len = len(str(ws.cell(row=1, column=col_idx).value or ''))
-            total_rows = len(rows)
-            for row_idx in range(2, total_rows + 2):
-                cell_val = str(ws.cell(row=row_idx, column=col_idx).value or '')
-                # For multiline cells, use the longest line
-                for line in cell_val.split('\n'):
-                    max_len = max(max_len, len(line))
-            col_letter = get_column_letter(col_idx)
-            width = min(max(max_len + 2, MIN_COL_WIDTH), MAX_COL_WIDTH)
-            ws.column_dimensions[col_letter].width = width
-
-        # Save with the same name but .xlsx extension
+        entry = cache.get(md_file.name)
+        state = _source_state(md_file, entry)
         dest_file = out_dir / f"{md_file.stem}.xlsx"
-        wb.save(str(dest_file))
-        print(f"Exported: {dest_file.name}")
-
+        # No entry means the export cannot be verified: export again
+        if entry and entry.get('digest') == state['digest'] and dest_file.exists():
+            cache[md_file.name] = state
+            print(f"Up to date: {dest_file.name}")
+        else:
+            pending[str(md_file)] = state
+
+    if max_workers == 1 or len(pending) < 2:
+        for md_path, state in pending.items():
+            exported, message = _export_one(md_path, str(out_dir))
+            if exported:
+                cache[Path(md_path).name] = state
+            print(message)
+    else:
+        # Files are independent, so export them in parallel worker processes
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(_export_one, f, str(out_dir)): f for f in pending}
+            for done in as_completed(futures):
+                exported, message = done.result()
+                if exported:
+                    md_path = futures[done]
+                    cache[Path(md_path).name] = pending[md_path]
+                print(message)
+
+    try:
+        (out_dir / CACHE_NAME).write_text(json.dumps(cache, indent=2, sort_keys=True),
+                                          encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: Could not write {CACHE_NAME}: {e}")
 
 
 def find_latest_project() -> Optional[Path]:
     """Find the most recently modified project directory."""
-    projects_dir = Path("projects")
-    if not projects_dir.exists():
+    try:
+        it = os.scandir("projects")
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
-    subdirs = [d for d in projects_dir.iterdir() if d.is_dir()]
-    if not subdirs:
-        return None
+    latest: Optional[str] = None
+    latest_mtime = -1.0
+    with it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime > latest_mtime:
+                latest_mtime, latest = mtime, entry.path
+
+    return Path(latest) if latest is not None else None
+
 
-    return max(subdirs, key=lambda d: d.stat().st_mtime)
+def _worker_count(value: str) -> int:
+    """argparse type for --workers: a non-negative integer (0 = one per CPU)."""
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {count}")
+    return count
 
 
 def main() -> None:
@@ -158,6 +327,8 @@ def main() -> None:
     )
     arg_parser.add_argument('results_dir', nargs='?', help='Path to results MD files')
     arg_parser.add_argument('output_path', nargs='?', help='Path to export XLSX files')
+    arg_parser.add_argument('--workers', type=_worker_count, default=0,
+                            help='Number of parallel worker processes (default: 0 = one per CPU)')
     args = arg_parser.parse_args()
 
     results_dir: Optional[str] = args.results_dir
@@ -174,7 +345,7 @@ def main() -> None:
             print("Error: No paths provided and no projects found in 'projects/' directory.")
             sys.exit(1)
 
-    export_to_xlsx(results_dir, output_path)
+    export_to_xlsx(results_dir, output_path, max_workers=args.workers or None)
 
 
 if __name__ == '__main__':